@@ -1,7 +1,15 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import joblib
+import json
+import os
+import time
+from corn_yield.config import model_file
+from corn_yield.drift import DriftMonitor, PredictionLogger, MIN_SAMPLES, log_file
+
+# Per-rerun timings (seconds). load_test.py sets PERF_LOG to collect them.
+timings = {}
+run_start = time.perf_counter()
 
 # Page Configuration
 st.set_page_config(
@@ -11,8 +19,6 @@ st.set_page_config(
 )
 
 # Load Model
-model_filename = 'best_corn_xgboost.pkl'
-
 @st.cache_resource
 def load_model(filename):
     try:
@@ -23,7 +29,32 @@ def load_model(filename):
     except FileNotFoundError:
         return None
     
-model = load_model(model_filename)
+model = load_model(model_file)
+
+# Prediction Log & Drift Monitoring
+# One logger and one monitor per server process, shared by all sessions.
+# The log works on its own; the monitor is optional on top of it.
+@st.cache_resource
+def load_prediction_logger():
+    # Moves aside an old log with different columns before appending
+    return PredictionLogger()
+
+@st.cache_resource
+def load_drift_monitor():
+    try:
+        monitor = DriftMonitor.from_training_file()
+    except FileNotFoundError:
+        return None, "Training data 'cleaned_data/processed_corn_data.csv' not found."
+    # Replay earlier predictions so the drift stats survive app restarts
+    try:
+        monitor.update_from_log()
+    except ValueError as e:
+        # Unreadable rows in the log. Predictions and logging keep working without monitoring.
+        return None, f"Prediction log '{log_file}' could not be read ({e})."
+    return monitor, None
+
+prediction_logger = load_prediction_logger()
+monitor, drift_error = load_drift_monitor()
 
 # Sidebar Inputs
 st.sidebar.header("🎛️ Field Parameters")
@@ -66,7 +97,9 @@ def user_input_features():
     }
     return pd.DataFrame(data, index=[0])
 
+t0 = time.perf_counter()
 input_df = user_input_features()
+timings['inputs'] = time.perf_counter() - t0
 
 # Main Dashboard
 st.title("🌽 Corn Yield Prediction System")
@@ -92,7 +125,23 @@ with col2:
         st.error(" Error: 'best_corn_xgboost.pkl' model file not found.")
     else:
         # Predict
+        t0 = time.perf_counter()
         prediction = model.predict(input_df)[0]
+        timings['predict'] = time.perf_counter() - t0
+
+        # Log the request (queued, written in the background) and update drift stats.
+        # Only inputs the user actually changed count: the untouched defaults of a
+        # new page open and reruns with the same inputs would bias PSI/KS.
+        current_input = tuple(input_df.iloc[0])
+        if 'last_logged_input' not in st.session_state:
+            st.session_state['last_logged_input'] = current_input
+        elif current_input != st.session_state['last_logged_input']:
+            t0 = time.perf_counter()
+            prediction_logger.log(input_df.iloc[0], prediction)
+            if monitor is not None:
+                monitor.update(input_df)
+            st.session_state['last_logged_input'] = current_input
+            timings['drift'] = time.perf_counter() - t0
 
         # Color Logic
         if prediction < 1.5:
@@ -154,9 +203,53 @@ with c3:
         st.success("**Balanced Soil Texture**")
         st.caption("Soil texture is well balanced for optimal corn growth.")
 
+# Drift Monitor Section
+st.markdown("---")
+st.subheader("📡 Input Drift Monitor")
+
+if monitor is None:
+    st.info(f"{drift_error} Drift monitoring is disabled.")
+else:
+    # Alert 1: This input is outside the training ranges
+    t0 = time.perf_counter()
+    flagged = monitor.out_of_range(input_df.iloc[0])
+    for col, (value, low, high) in flagged.items():
+        st.warning(f"**{col} = {value:.2f}** is outside the training range ({low:.2f} - {high:.2f}). Treat this forecast with caution.")
+
+    # Alert 2: The logged inputs as a whole have drifted away from the training data
+    drift_df = monitor.report()
+    timings['drift'] = timings.get('drift', 0.0) + time.perf_counter() - t0
+    if monitor.n_seen < MIN_SAMPLES:
+        st.caption(f"Collected {monitor.n_seen} of {MIN_SAMPLES} predictions needed for drift statistics.")
+    else:
+        drifted = drift_df[drift_df['Status'] == 'Significant shift'].index.tolist()
+        shifted = drift_df[drift_df['Status'] == 'Moderate shift'].index.tolist()
+        if drifted:
+            st.error(f"**Significant Drift Alert**: {', '.join(drifted)} (PSI > 0.25). Field conditions no longer match the training data.")
+        elif shifted:
+            st.warning(f"**Moderate Drift Warning**: {', '.join(shifted)} (PSI > 0.10).")
+        else:
+            st.success("**Inputs Stable**")
+        st.caption(f"Based on {monitor.n_seen} logged predictions.")
+
+    with st.expander("Drift details (PSI / KS per feature)"):
+        st.dataframe(drift_df.round(4))
+
 st.markdown("----")
 st.caption("© 2025 Corn Yield Predictor")
 
+# Everything that is not input building, prediction or drift work is rendering
+timings['total'] = time.perf_counter() - run_start
+timings['render'] = timings['total'] - sum(timings.get(k, 0.0) for k in ('inputs', 'predict', 'drift'))
+
+perf_log = os.environ.get('PERF_LOG')
+if perf_log:
+    # First run of a session = page load (cache loading, untouched sliders)
+    timings['first_run'] = 'perf_seen' not in st.session_state
+    st.session_state['perf_seen'] = True
+    with open(perf_log, 'a') as f:
+        f.write(json.dumps(timings) + '\n')
+
 
 import warnings
 import logging
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Compare cold-start import cost of every entry point before and after the
+# move to the lazy `corn_yield` CLI, using `python -X importtime`.
+# "Before" is the import block of each original script; "after" is what the CLI
+# command imports up to its first real work. Both include imports that only
+# happen at run time (openpyxl in read_excel, xgboost when unpickling the model,
+# matplotlib/seaborn when plotting), so the two columns cover the same work.
+CLI = "import corn_yield.cli, corn_yield.{}"
+PLOTTING = "from corn_yield.plotting import get_pyplot; get_pyplot()"
+
+ENTRY_POINTS = {
+    'etl': (
+        "import pandas, seaborn, matplotlib.pyplot, openpyxl",
+        CLI.format('etl') + "; import openpyxl",
+    ),
+    'verify': (
+        "import pandas, matplotlib.pyplot, seaborn",
+        CLI.format('verify') + "; import seaborn; " + PLOTTING,
+    ),
+    'verify --no-plot': (
+        "import pandas, matplotlib.pyplot, seaborn",
+        CLI.format('verify'),
+    ),
+    'baseline': (
+        "import pandas, numpy, sklearn.model_selection, sklearn.ensemble, sklearn.metrics, "
+        "matplotlib.pyplot, seaborn",
+        CLI.format('baseline') + "; import seaborn; " + PLOTTING,
+    ),
+    'baseline --no-plot': (
+        "import pandas, numpy, sklearn.model_selection, sklearn.ensemble, sklearn.metrics, "
+        "matplotlib.pyplot, seaborn",
+        CLI.format('baseline'),
+    ),
+    'tune': (
+        "import pandas, numpy, xgboost, sklearn.model_selection, sklearn.metrics, joblib",
+        CLI.format('tune'),
+    ),
+    'explain': (
+        "import pandas, shap, xgboost, matplotlib.pyplot, joblib",
+        CLI.format('explain') + "; import xgboost; " + PLOTTING,
+    ),
+    # The app script's first run (model unpickling imports xgboost)
+    'serve (app)': (
+        "import streamlit, pandas, numpy, joblib, xgboost",
+        "import streamlit, pandas, joblib, xgboost, corn_yield.drift",
+    ),
+}
+
+output_file = 'benchmarks/import_times.json'
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time_ms(statement, repeats):
+    # Median of `repeats` fresh interpreters; total = sum of the top-level cumulative times
+    totals = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', statement],
+            capture_output=True, text=True, cwd=repo_root
+        )
+        if result.returncode != 0:
+            return None
+        total_us = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not name.startswith(' ' * 2):   # Nested imports are indented further
+                total_us += int(cumulative)
+        totals.append(total_us)
+    return statistics.median(totals) / 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time comparison of every entry point.")
+    parser.add_argument('--repeats', type=int, default=5, help="Fresh interpreters per measurement (the median is kept)")
+    args = parser.parse_args()
+
+    # Identical statements (e.g. the "before" of verify and verify --no-plot) are
+    # measured once and reused, so they can't disagree because of noise
+    measured = {}
+
+    def measure(statement):
+        if statement not in measured:
+            measured[statement] = import_time_ms(statement, args.repeats)
+        return measured[statement]
+
+    results = {}
+    print(f"{'Entry point':<20}{'before (ms)':>14}{'after (ms)':>14}{'saved':>10}")
+    for name, (before, after) in ENTRY_POINTS.items():
+        before_ms = measure(before)
+        after_ms = measure(after)
+        results[name] = {'before_ms': before_ms, 'after_ms': after_ms}
+
+        if before_ms is None or after_ms is None:
+            print(f"{name:<20}{'n/a':>14}{'n/a':>14}   (missing dependency, install requirements.txt)")
+            continue
+        saved = (before_ms - after_ms) / before_ms * 100
+        print(f"{name:<20}{before_ms:>14.1f}{after_ms:>14.1f}{saved:>9.1f}%")
+
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved results to '{output_file}'")
@@ -0,0 +1,5 @@
+"""Corn yield prediction pipeline.
+
+Run the phases with ``python -m corn_yield <command>``. Every command imports
+only the libraries it needs, so nothing heavy is loaded at package import.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from corn_yield.cli import main
+
+sys.exit(main())
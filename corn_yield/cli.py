@@ -0,0 +1,52 @@
+import argparse
+import importlib
+import subprocess
+import sys
+
+from corn_yield.config import app_file
+
+# Command -> (module, help text).
+# Modules are imported only when their command runs, so `etl` never pays for
+# sklearn/xgboost and `verify --no-plot` never loads matplotlib.
+COMMANDS = {
+    'etl': ('corn_yield.etl', "Phase 1: clean the raw data"),
+    'verify': ('corn_yield.verify', "Audit the cleaned data (leakage, pH, distribution)"),
+    'baseline': ('corn_yield.baseline', "Phase 2: Random Forest baseline & ablation study"),
+    'tune': ('corn_yield.tune', "Phase 3: tune and save the XGBoost model"),
+    'explain': ('corn_yield.explain', "Phase 4: SHAP interpretation plots"),
+    'drift': ('corn_yield.drift', "Drift report of logged predictions vs. training data"),
+}
+
+
+def serve(streamlit_args):
+    # Phase 5: hand over to Streamlit (it imports the app and its dependencies itself)
+    cmd = [sys.executable, '-m', 'streamlit', 'run', app_file] + streamlit_args
+    return subprocess.call(cmd)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='corn_yield', description="Corn yield prediction pipeline.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    for name, (module, help_text) in COMMANDS.items():
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.set_defaults(module=module)
+        if name in ('verify', 'baseline'):
+            cmd.add_argument('--no-plot', action='store_true', help="Skip the plot (and the matplotlib import)")
+
+    # Any other options (e.g. --server.port 8000) are passed on to `streamlit run`
+    cmd = sub.add_parser('serve', help="Phase 5: launch the Streamlit app")
+    cmd.set_defaults(module=None)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'serve':
+        if extra[:1] == ['--']:
+            extra = extra[1:]
+        return serve(extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return importlib.import_module(args.module).main(args)
@@ -0,0 +1,19 @@
+# Shared paths and column lists for every phase of the pipeline.
+# Paths are relative to the repository root (run commands from there).
+
+raw_file = 'data/raw_corn_data.xlsx'
+clean_file = 'cleaned_data/processed_corn_data.csv'
+model_file = 'best_corn_xgboost.pkl'
+plots_dir = 'plots'
+
+# Columns that are never model inputs
+drop_cols = ['District', 'State', 'Yield_per_Ha']
+
+# Must match the exact columns used during training
+FEATURES = [
+    'Avg_Temp', 'Min_Temp', 'Max_Temp', 'Avg_Precipitation', 'Wind_Speed',
+    'pH', 'Clay', 'Sand', 'Silt'
+]
+
+# Streamlit script launched by `python -m corn_yield serve`
+app_file = '05_deployment_app.py'
@@ -0,0 +1,224 @@
+import csv
+import os
+import queue
+import threading
+import time
+import atexit
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from corn_yield.config import clean_file, FEATURES
+
+# Configuration
+# Overridable so load tests don't pollute the real log
+log_file = os.environ.get('PREDICTION_LOG', 'logs/prediction_log.csv')
+
+LOG_COLUMNS = ['Timestamp'] + FEATURES + ['Prediction']
+
+# Drift thresholds (industry rule of thumb for PSI)
+# PSI < 0.10 -> Stable, 0.10 - 0.25 -> Moderate shift, > 0.25 -> Significant shift
+PSI_WARNING = 0.10
+PSI_ALERT = 0.25
+MIN_SAMPLES = 100   # Don't raise drift alerts on a handful of predictions
+N_BINS = 10         # Deciles of the training data
+EPS = 1e-6          # Avoid log(0) when a bin is empty
+
+
+# ---- Part 1: Prediction Log (append-only, batched) ----
+# The app must never wait on disk. log() only puts the row on a queue,
+# and a background thread appends rows to the CSV in batches.
+class PredictionLogger:
+    def __init__(self, filename=log_file, batch_size=256, flush_interval=2.0):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._rotate_if_incompatible()
+
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+        # Write whatever is still queued when the process shuts down
+        atexit.register(self.close)
+
+    def _rotate_if_incompatible(self):
+        # A log written with other columns can't be appended to or replayed.
+        # Move it aside (prediction_log.<timestamp>.csv) and start a new one.
+        if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
+            return
+        with open(self.filename, newline='') as f:
+            header = next(csv.reader(f), [])
+        if header != LOG_COLUMNS:
+            root, ext = os.path.splitext(self.filename)
+            stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+            rotated = f"{root}.{stamp}{ext}"
+            os.replace(self.filename, rotated)
+            print(f" Prediction log has different columns. Moved it to '{rotated}'.")
+
+    def log(self, features, prediction):
+        row = [datetime.now(timezone.utc).isoformat(timespec='seconds')]
+        row += [float(features[col]) for col in FEATURES]
+        row.append(float(prediction))
+        self._queue.put(row)
+
+    def _drain(self, first_row):
+        batch = [first_row]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        new_file = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+        with open(self.filename, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(LOG_COLUMNS)
+            writer.writerows(batch)
+
+    def _writer(self):
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                first_row = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            self._write(self._drain(first_row))
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=self.flush_interval + 5)
+
+
+# ---- Part 2: Streaming Drift Monitor ----
+# For every feature we fix the bin edges once, from the training deciles.
+# Each logged prediction only increments one counter per feature, so memory
+# stays constant (N_BINS + 2 counters per feature) no matter how many
+# predictions we see. The two extra bins catch values outside the training range.
+class DriftMonitor:
+    def __init__(self, train_df, n_bins=N_BINS):
+        self.edges = {}
+        self.train_props = {}
+        self.train_min = {}
+        self.train_max = {}
+        self.counts = {}
+        self.n_seen = 0
+        self._lock = threading.Lock()
+
+        for col in FEATURES:
+            values = train_df[col].to_numpy(dtype=float)
+            # Interior edges only; np.unique handles features with repeated values (e.g. pH)
+            inner = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)))[1:-1]
+            self.train_min[col] = values.min()
+            self.train_max[col] = values.max()
+            self.edges[col] = np.concatenate(([self.train_min[col]], inner, [self.train_max[col]]))
+            train_counts = self._bin_counts(col, values)
+            self.train_props[col] = train_counts / train_counts.sum()
+            self.counts[col] = np.zeros(len(train_counts), dtype=np.int64)
+
+    @classmethod
+    def from_training_file(cls, filename=clean_file, n_bins=N_BINS):
+        return cls(pd.read_csv(filename), n_bins=n_bins)
+
+    def _bin_counts(self, col, values):
+        # Bin 0 = below training min, last bin = above training max
+        edges = self.edges[col]
+        idx = np.searchsorted(edges, values, side='right')
+        # Exactly the training max belongs to the last in-range bin, not the overflow bin
+        idx[values == edges[-1]] = len(edges) - 1
+        return np.bincount(idx, minlength=len(edges) + 1).astype(float)
+
+    def update(self, frame):
+        # frame: DataFrame with the FEATURES columns (one row from the app or a log chunk)
+        with self._lock:
+            for col in FEATURES:
+                values = frame[col].to_numpy(dtype=float)
+                self.counts[col] += self._bin_counts(col, values).astype(np.int64)
+            self.n_seen += len(frame)
+
+    def update_from_log(self, filename=log_file, chunksize=100_000):
+        # Reads the log in chunks so millions of rows never sit in memory at once
+        # A 0-byte log (created but never written) has nothing to replay
+        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+            return 0
+        total = 0
+        for chunk in pd.read_csv(filename, usecols=FEATURES, chunksize=chunksize):
+            self.update(chunk)
+            total += len(chunk)
+        return total
+
+    def out_of_range(self, row):
+        # Features of a single input that fall outside what the model was trained on
+        flagged = {}
+        for col in FEATURES:
+            value = float(row[col])
+            if value < self.train_min[col] or value > self.train_max[col]:
+                flagged[col] = (value, self.train_min[col], self.train_max[col])
+        return flagged
+
+    def report(self):
+        with self._lock:
+            counts = {col: self.counts[col].copy() for col in FEATURES}
+            n_seen = self.n_seen
+
+        rows = []
+        for col in FEATURES:
+            expected = self.train_props[col]
+            if n_seen > 0:
+                actual = counts[col] / n_seen
+            else:
+                actual = np.zeros_like(expected)
+
+            # Population Stability Index
+            e = np.clip(expected, EPS, None)
+            a = np.clip(actual, EPS, None)
+            psi = float(np.sum((a - e) * np.log(a / e)))
+
+            # Kolmogorov-Smirnov statistic on the binned CDFs
+            ks = float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+
+            if n_seen < MIN_SAMPLES:
+                status = 'Not enough data'
+            elif psi > PSI_ALERT:
+                status = 'Significant shift'
+            elif psi > PSI_WARNING:
+                status = 'Moderate shift'
+            else:
+                status = 'Stable'
+
+            rows.append({
+                'Feature': col,
+                'PSI': psi,
+                'KS': ks,
+                'Out_of_Range_%': 100 * (actual[0] + actual[-1]),
+                'Status': status
+            })
+
+        return pd.DataFrame(rows).set_index('Feature')
+
+
+def main(args=None):
+    # Offline drift report over the full prediction log
+    print(f"[Drift] Loading training distribution from '{clean_file}'...")
+    monitor = DriftMonitor.from_training_file()
+
+    start = time.perf_counter()
+    n_rows = monitor.update_from_log()
+    elapsed = time.perf_counter() - start
+
+    if n_rows == 0:
+        print(f"No predictions logged yet. Run the app first ('{log_file}' is empty or missing).")
+        return
+
+    print(f"[Drift] Scanned {n_rows} logged predictions in {elapsed:.2f}s.")
+    print("\n" + "="*40)
+    print("DRIFT REPORT (vs. training data)")
+    print("="*40)
+    print(monitor.report().round(4).to_string())
@@ -0,0 +1,53 @@
+import pandas as pd
+import shap
+import joblib
+
+from corn_yield.config import clean_file, model_file, drop_cols
+from corn_yield.plotting import get_pyplot, save_plot
+
+
+def main(args=None):
+    print(" Starting SHAP Interpretation ...")
+
+    # 1. Load Data & Model
+    try:
+        df = pd.read_csv(clean_file)
+        model = joblib.load(model_file)
+    except FileNotFoundError:
+        print(" Error: Missing model or Data file.")
+        return 1
+
+    # 2. Prepare Features (X)
+    # Must match the exact columns used during training
+    X = df.drop(columns=[col for col in drop_cols if col in df.columns])
+
+    print(f" Analyzing {len(X)} samples...")
+
+    # 3. Calculate SHAP Values
+    # SHAP explains the output of the model. It tells us, for every single row,
+    # how much each feature pushed the prediction UP or DOWN.
+    explainer = shap.Explainer(model)
+    shap_values = explainer(X)
+
+    plt = get_pyplot()
+
+    # 4. PLOT 1: THE SUMMARY (Beeswarm)
+    # This shows the direction of the relationship.
+    # Red = High Value of Feature, Blue = Low Value of Feature
+    # Right = Higher Yield, Left = Lower Yield
+    plt.figure(figsize=(10, 6))
+    shap.summary_plot(shap_values, X, show=False)
+    plt.title("SHAP Summary: How Features Impact Yield")
+    plt.tight_layout()
+    save_plot(plt, 'shap_summary.png')
+
+    # 5. PLOT 2: THE PHYSICS CHECK (Dependence)
+    # Let's check the #1 driver: Max_Temp.
+    # Does the curve look like a hill (Goldilocks zone)?
+    # Then #2: Precipitation
+    for feature in ['Max_Temp', 'Avg_Precipitation']:
+        if feature in X.columns:
+            shap.dependence_plot(feature, shap_values.values, X, show=False)
+            plt.title(f"Impact of {feature} on Yield")
+            plt.grid(True, alpha=0.3)
+            save_plot(plt, f'shap_dependence_{feature}.png')
@@ -0,0 +1,21 @@
+import os
+
+from corn_yield.config import plots_dir
+
+
+def get_pyplot():
+    # Headless backend: figures are saved to files, never shown in a window.
+    # Imported here (not at module level) so commands that skip plotting never load matplotlib.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_plot(plt, filename):
+    os.makedirs(plots_dir, exist_ok=True)
+    path = os.path.join(plots_dir, filename)
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+    plt.close('all')
+    print(f" Plot saved to '{path}'")
+    return path
@@ -0,0 +1,278 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from corn_yield.config import app_file
+
+# Configuration
+baseline_file = 'benchmarks/latency_baseline.json'
+PHASES = ['inputs', 'predict', 'drift', 'render', 'total']
+DEGRADE_FACTOR = 2.0   # p95 is "degraded" once it is 2x the lowest-concurrency p95
+
+# Sidebar sliders in the order the app creates them: (min, max, is_integer)
+SLIDERS = [
+    (20.0, 40.0, False),   # Max Temperature
+    (10.0, 30.0, False),   # Min Temperature
+    (0.0, 300.0, False),   # Rainfall
+    (0.0, 10.0, False),    # Wind Speed
+    (4.0, 9.0, False),     # Soil pH
+    (0, 100, True),        # Clay %
+    (0, 100, True),        # Sand %
+    (0, 100, True),        # Silt %
+]
+
+
+def random_inputs(rng):
+    values = []
+    for low, high, is_int in SLIDERS:
+        if is_int:
+            values.append(rng.randint(low, high))
+        else:
+            values.append(round(rng.uniform(low, high), 2))
+    return values
+
+
+# ---- The app server ----
+# One real `streamlit run` process, exactly like production: every session
+# shares its cached model, the DriftMonitor lock, the logger queue and the GIL.
+# The app writes its per-rerun phase timings to PERF_LOG; predictions go to a
+# temporary log so the real logs/prediction_log.csv stays clean.
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, workdir):
+    env = dict(os.environ,
+               PERF_LOG=os.path.join(workdir, 'perf_log.jsonl'),
+               PREDICTION_LOG=os.path.join(workdir, 'prediction_log.csv'))
+    cmd = [sys.executable, '-m', 'streamlit', 'run', app_file,
+           '--server.headless', 'true', '--server.port', str(port),
+           '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false']
+    server = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Streamlit server exited during start-up.")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1):
+                return server, env['PERF_LOG']
+        except OSError:
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError("Streamlit server did not become healthy within 60s.")
+
+
+# ---- One simulated user ----
+# A headless browser: one websocket session that opens the app, then moves the
+# sliders `n_reruns` times. Every slider change is one Streamlit rerun.
+async def wait_for_rerun(ws, sliders):
+    while True:
+        msg = ForwardMsg()
+        msg.ParseFromString(await ws.recv())
+        kind = msg.WhichOneof('type')
+        if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            element = msg.delta.new_element
+            if element.WhichOneof('type') == 'slider':
+                sliders.append(element.slider.id)
+            elif element.WhichOneof('type') == 'exception':
+                raise RuntimeError(f"App raised an exception: {element.exception.message}")
+        elif kind == 'script_finished':
+            return
+
+
+async def run_session(port, session_id, n_reruns, seed, barrier):
+    rng = random.Random(seed + session_id)
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as ws:
+        # Page load: the first rerun also tells us the slider widget ids
+        sliders = []
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        await ws.send(msg.SerializeToString())
+        await wait_for_rerun(ws, sliders)
+
+        # Wait until every session has loaded the page, so the warm reruns overlap
+        await barrier.wait()
+
+        records = []
+        for _ in range(n_reruns):
+            msg = BackMsg()
+            for widget_id, value in zip(sliders, random_inputs(rng)):
+                widget = msg.rerun_script.widget_states.widgets.add()
+                widget.id = widget_id
+                widget.double_array_value.data.append(value)
+
+            start_ts = time.time()
+            start = time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            await wait_for_rerun(ws, [])
+            records.append({'wall': time.perf_counter() - start,
+                            'start_ts': start_ts, 'end_ts': time.time()})
+        return records
+
+
+# ---- Many concurrent users against the one server ----
+async def run_level(port, n_sessions, n_reruns, seed):
+    barrier = asyncio.Barrier(n_sessions)
+    results = await asyncio.gather(*[run_session(port, s, n_reruns, seed, barrier)
+                                     for s in range(n_sessions)])
+    return [r for session in results for r in session]
+
+
+def read_perf_log(perf_log, offset):
+    with open(perf_log) as f:
+        f.seek(offset)
+        records = [json.loads(line) for line in f if line.strip()]
+    return [r for r in records if not r['first_run']]
+
+
+def percentiles(values):
+    values = np.array(values) * 1000   # ms
+    return {
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p95_ms': float(np.percentile(values, 95)),
+        'p99_ms': float(np.percentile(values, 99)),
+    }
+
+
+def summarize(client_records, server_records):
+    # Throughput over the window where all sessions were rerunning together
+    window = max(r['end_ts'] for r in client_records) - min(r['start_ts'] for r in client_records)
+    summary = {'reruns': len(client_records), 'window_s': window,
+               'reruns_per_s': len(client_records) / window, 'phases': {}}
+    for phase in PHASES:
+        summary['phases'][phase] = percentiles([r.get(phase, 0.0) for r in server_records])
+    # Wall = what the user waits for: queueing + script + websocket round trip
+    summary['phases']['wall'] = percentiles([r['wall'] for r in client_records])
+    return summary
+
+
+def print_level(n_sessions, summary, base=None):
+    print("\n" + "="*64)
+    print(f"LATENCY REPORT ({n_sessions} concurrent sessions, {summary['reruns']} warm reruns, "
+          f"{summary['reruns_per_s']:.1f} reruns/s)")
+    print("="*64)
+    print(f"{'Phase':<10}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'vs base':>12}")
+    for phase, stats in summary['phases'].items():
+        delta = ''
+        if base is not None:
+            base_p50 = base['phases'][phase]['p50_ms']
+            if base_p50 > 0:
+                delta = f"{(stats['p50_ms'] - base_p50) / base_p50 * 100:+.1f}%"
+        print(f"{phase:<10}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>10.2f}"
+              f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{delta:>12}")
+
+    # Hot spots: share of the script time spent in each phase
+    total = summary['phases']['total']['mean_ms']
+    print("\n--- Hot Spots (share of script time) ---")
+    shares = {p: summary['phases'][p]['mean_ms'] / total for p in ['inputs', 'predict', 'drift', 'render']}
+    for phase, share in sorted(shares.items(), key=lambda kv: kv[1], reverse=True):
+        print(f" - {phase:<8} {share*100:5.1f}%")
+    # Wall time also includes waiting for the server and the websocket round trip
+    overhead = summary['phases']['wall']['mean_ms'] - total
+    print(f" (Queueing + Streamlit + network outside the script: {overhead:.2f} ms per rerun)")
+
+
+def print_sweep(levels):
+    print("\n" + "="*64)
+    print("CONCURRENCY SWEEP")
+    print("="*64)
+    print(f"{'sessions':>8}{'reruns/s':>12}{'wall p50':>12}{'wall p95':>12}{'script p95':>12}")
+    reference = None
+    degraded_at = None
+    for n_sessions, summary in levels.items():
+        wall_p95 = summary['phases']['wall']['p95_ms']
+        if reference is None:
+            reference = wall_p95
+        flag = ''
+        if wall_p95 > DEGRADE_FACTOR * reference:
+            flag = '  <- p95 degraded'
+            if degraded_at is None:
+                degraded_at = n_sessions
+        print(f"{n_sessions:>8}{summary['reruns_per_s']:>12.1f}{summary['phases']['wall']['p50_ms']:>12.1f}"
+              f"{wall_p95:>12.1f}{summary['phases']['total']['p95_ms']:>12.1f}{flag}")
+
+    if degraded_at is None:
+        print(f"\np95 stayed within {DEGRADE_FACTOR:.0f}x of the {next(iter(levels))}-session p95 at every level.")
+    else:
+        print(f"\np95 degrades (> {DEGRADE_FACTOR:.0f}x the {next(iter(levels))}-session p95) from {degraded_at} sessions.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent load test for the Streamlit app.")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4],
+                        help="Concurrency levels to sweep (concurrent users against one server)")
+    parser.add_argument('--reruns', type=int, default=25, help="Slider changes per user")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for the slider values (reproducible runs)")
+    parser.add_argument('--save', action='store_true', help=f"Save the results as the new baseline ('{baseline_file}')")
+    parser.add_argument('--compare', default=baseline_file, help="Baseline JSON to compare against")
+    args = parser.parse_args()
+
+    if args.reruns < 1 or min(args.sessions) < 1:
+        parser.error("--sessions and --reruns must be at least 1")
+    sweep = sorted(set(args.sessions))
+    config = {'sessions': sweep, 'reruns': args.reruns, 'seed': args.seed}
+
+    baseline = None
+    if os.path.exists(args.compare):
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get('config') != config:
+            print(f"WARNING: baseline '{args.compare}' was recorded with {baseline.get('config')}, "
+                  f"this run uses {config}. Not comparing.")
+            baseline = None
+        else:
+            print(f"Comparing against baseline '{args.compare}'")
+
+    workdir = tempfile.mkdtemp()
+    port = free_port()
+    print(f"[Load Test] Starting one Streamlit server for '{app_file}' on port {port}...")
+    server, perf_log = start_server(port, workdir)
+
+    levels = {}
+    try:
+        for n_sessions in sweep:
+            print(f"[Load Test] {n_sessions} concurrent sessions x {args.reruns} reruns...")
+            offset = os.path.getsize(perf_log) if os.path.exists(perf_log) else 0
+            client_records = asyncio.run(run_level(port, n_sessions, args.reruns, args.seed))
+            time.sleep(0.5)   # Let the last script runs finish writing their timings
+            server_records = read_perf_log(perf_log, offset)
+
+            # Without a model the app skips prediction; the numbers would be meaningless
+            if not server_records or any('predict' not in r for r in server_records):
+                print("Error: the app made no predictions. Is 'best_corn_xgboost.pkl' missing? "
+                      "Run `python -m corn_yield tune` first.")
+                sys.exit(1)
+
+            levels[n_sessions] = summarize(client_records, server_records)
+    finally:
+        server.terminate()
+        server.wait()
+
+    for n_sessions, summary in levels.items():
+        base = baseline['levels'][str(n_sessions)] if baseline else None
+        print_level(n_sessions, summary, base)
+    print_sweep(levels)
+
+    if args.save:
+        os.makedirs(os.path.dirname(baseline_file), exist_ok=True)
+        with open(baseline_file, 'w') as f:
+            json.dump({'config': config, 'levels': {str(n): s for n, s in levels.items()}}, f, indent=2)
+        print(f"\nSaved baseline to '{baseline_file}'")